@@ -5,52 +5,500 @@ This app provides an interface to search for academic works and authors
 using the OpenAlex API.
 """
 
+import numpy as np
+import orjson
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from collections import defaultdict
-import statistics
+from collections import Counter, OrderedDict
+import functools
+import operator
+import os
+import re
+import threading
+import time
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode br responses)
+    # Brotli compresses OpenAlex JSON noticeably better than gzip
+    ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+
+OPENALEX_API_URL = "https://api.openalex.org"
+# Contact address sent for polite pool access unless OPENALEX_MAILTO is set
+DEFAULT_MAILTO = "streamlit-openalex-app@example.com"
+# Matches the API key query parameter in URLs quoted by request errors
+_API_KEY_PATTERN = re.compile(r"(api_key=)[^&\s'\"]+")
+WORKS_URL = f"{OPENALEX_API_URL}/works"
+AUTHORS_URL = f"{OPENALEX_API_URL}/authors"
+AUTOCOMPLETE_AUTHORS_URL = f"{OPENALEX_API_URL}/autocomplete/authors"
+
+# Only the fields rendered by format_work / display_authors. OpenAlex accepts
+# root-level fields only (no "primary_location.source.display_name" paths), so
+# authorships and primary_location come back whole.
+WORKS_SELECT = "id,title,authorships,publication_year,primary_location,cited_by_count,doi"
+AUTHORS_SELECT = (
+    "id,display_name,orcid,last_known_institution,works_count,"
+    "cited_by_count,summary_stats,x_concepts"
+)
+# Only the fields used by calculate_academic_age / calculate_author_metrics
+AUTHOR_WORKS_SELECT = "id,publication_year,cited_by_count,concepts"
+
+# (connect, read) timeouts in seconds for OpenAlex requests; the connect timeout
+# sits just above the 3 s TCP retransmission window, and the read timeout
+# leaves room for slow deep-cursor and group_by responses
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Requests per second the whole process may start, matching OpenAlex's
+# polite-pool limit of about 10 requests per second
+MAX_REQUESTS_PER_SECOND = 10
+
+# Longest single wait in seconds between retries (backoff or Retry-After)
+RETRY_WAIT_MAX = 10
+
+TITLE_MD = "🔍 OpenAlex Search"
+
+INTRO_MD = """
+Search for academic works and authors using the [OpenAlex API](https://docs.openalex.org/).
+OpenAlex is a free and open catalog of scholarly papers, authors, institutions, and more.
+"""
+
+FOOTER_HTML = """
+<div style='text-align: center'>
+    <small>
+    Data from <a href="https://openalex.org" target="_blank">OpenAlex</a> |
+    <a href="https://docs.openalex.org/" target="_blank">API Documentation</a>
+    </small>
+</div>
+"""
 
 
-def search_openalex_works(query: str, per_page: int = 10, page: int = 1) -> Dict[str, Any]:
+def get_setting(name: str) -> Optional[str]:
     """
-    Search for works in OpenAlex API.
+    Read an optional setting from Streamlit secrets or the environment.
 
     Args:
-        query: Search query string
-        per_page: Number of results per page (default: 10)
-        page: Page number (default: 1)
+        name: Setting name, e.g. "OPENALEX_API_KEY"
+
+    Returns:
+        The value from st.secrets, else from the environment, else None
+    """
+    try:
+        value = st.secrets.get(name)
+    except (FileNotFoundError, StreamlitAPIException):
+        # No secrets.toml configured
+        value = None
+    return value or os.environ.get(name)
+
+
+class BoundedRetry(Retry):
+    """Retry policy whose Retry-After waits are capped like its backoff."""
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        """
+        Get the wait requested by a Retry-After header, capped at RETRY_WAIT_MAX.
+
+        Args:
+            response: urllib3 response that was rate limited or unavailable
+
+        Returns:
+            Seconds to wait, or None if the header is absent
+        """
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_WAIT_MAX)
+
+
+def describe_error(error: Exception) -> str:
+    """
+    Format a request error for display in the UI.
+
+    Failed request URLs appear in HTTPError and urllib3 retry messages and
+    carry the api_key query parameter, so its value is masked.
+
+    Args:
+        error: Exception raised while calling the OpenAlex API
+
+    Returns:
+        Error message with any API key redacted
+    """
+    return _API_KEY_PATTERN.sub(r"\1REDACTED", str(error))
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for OpenAlex API calls.
+
+    The session is cached as a Streamlit resource so that every rerun and
+    every user reuses the same keep-alive connection pool instead of opening
+    a new TCP+TLS connection for each request.
+
+    Returns:
+        Configured requests.Session instance
+    """
+    session = requests.Session()
+    # Polite pool access requires the literal "mailto:" with a contact address.
+    # Without an API key the pool is limited to roughly 10 requests/s overall.
+    mailto = get_setting("OPENALEX_MAILTO") or DEFAULT_MAILTO
+    session.headers.update({
+        "User-Agent": f"streamlit-openalex-app (mailto:{mailto})",
+        "Accept-Encoding": ACCEPT_ENCODING,
+    })
+    # An API key lifts the rate limit; session params go out with every request
+    api_key = get_setting("OPENALEX_API_KEY")
+    if api_key:
+        session.params = {"api_key": api_key}
+    # Retry transient rate-limit and server errors (529: overloaded) with
+    # exponential backoff, honouring Retry-After when the API sends it. The
+    # counts keep one request under a 120 s budget even in the worst case of
+    # 2 read timeouts, 3 connect timeouts and 4 waits of RETRY_WAIT_MAX (~109 s).
+    retry = BoundedRetry(
+        total=4,
+        connect=2,
+        read=1,
+        status=4,
+        backoff_factor=1.5,
+        backoff_max=RETRY_WAIT_MAX,
+        status_forcelist=(429, 500, 502, 503, 504, 529),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+    )
+    # Sized so concurrent Streamlit sessions and background requests share
+    # keep-alive connections instead of discarding them when the pool is full
+    session.mount(
+        OPENALEX_API_URL,
+        HTTPAdapter(pool_connections=8, pool_maxsize=64, pool_block=False, max_retries=retry),
+    )
+    # Type-ahead must fail fast rather than back off, so autocomplete gets its
+    # own adapter without retries (the most specific mounted prefix wins)
+    session.mount(AUTOCOMPLETE_AUTHORS_URL, HTTPAdapter(pool_maxsize=16, max_retries=0))
+    return session
+
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used for background OpenAlex requests.
+
+    Its size bounds how many background requests run at once; the request
+    rate itself is limited separately by get_rate_limiter.
+
+    Returns:
+        ThreadPoolExecutor shared across reruns and users
+    """
+    return ThreadPoolExecutor(max_workers=10)
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still in flight wait for it and share its result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple, Future] = {}
+
+    def run(self, key: Tuple, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run func(*args) unless a call with the same key is already in flight.
+
+        Args:
+            key: Hashable identifier of the call
+            func: Function to run
+            *args: Arguments passed to func
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+@st.cache_resource
+def get_single_flight() -> SingleFlight:
+    """
+    Get the shared registry of in-flight OpenAlex requests.
+
+    Returns:
+        SingleFlight instance shared across reruns and users
+    """
+    return SingleFlight()
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how often requests may start, across all threads.
+
+    Callers over the rate reserve a future token and sleep until it is due,
+    so bursts up to the bucket size pass immediately and sustained load is
+    smoothed to the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        # Sleep outside the lock so other callers can reserve their own slots
+        if delay > 0:
+            time.sleep(delay)
+
+
+@st.cache_resource
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide limiter for OpenAlex requests.
+
+    Returns:
+        RateLimiter shared across reruns and users
+    """
+    return RateLimiter(rate=MAX_REQUESTS_PER_SECOND, burst=MAX_REQUESTS_PER_SECOND)
+
+
+class OpenAlexError(requests.exceptions.RequestException):
+    """An OpenAlex response that is not a usable JSON document, despite its HTTP status."""
+
+
+class RevalidationStore:
+    """
+    Bounded LRU store of response validators for conditional requests.
+
+    Keeps the ETag / Last-Modified validators and raw body of recent
+    responses, so that a request repeated after its st.cache_data entry has
+    expired can be answered by a headers-only 304 Not Modified.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[Dict[str, str], bytes]]" = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, key: Tuple) -> Optional[Tuple[Dict[str, str], bytes]]:
+        """
+        Look up the conditional headers and body stored for a request.
+
+        Args:
+            key: Hashable identifier of the request
+
+        Returns:
+            Tuple of (conditional request headers, raw body), or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple, headers: Dict[str, str], body: bytes) -> None:
+        """
+        Store the conditional headers and body of a response, evicting the oldest entries.
+
+        Args:
+            key: Hashable identifier of the request
+            headers: Conditional request headers (If-None-Match, If-Modified-Since)
+            body: Raw response body
+        """
+        with self._lock:
+            self._entries[key] = (headers, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource
+def get_revalidation_store() -> RevalidationStore:
+    """
+    Get the shared store of response validators.
+
+    Returns:
+        RevalidationStore instance shared across reruns and users
+    """
+    return RevalidationStore()
+
+
+def _fetch_json(url: str, params: Dict[str, Any], timeout: Any = REQUEST_TIMEOUT,
+                revalidate: bool = True) -> Dict[str, Any]:
+    """
+    Fetch a JSON document from the OpenAlex API using the shared session.
+
+    Requests are paced by the process-wide rate limiter. Errors are raised
+    rather than reported so that cached callers never memoize a failed
+    request. When revalidate is set, responses carrying an ETag or
+    Last-Modified header are revalidated with a conditional request next
+    time, and the stored body is reused on 304 Not Modified.
+
+    Args:
+        url: OpenAlex endpoint URL
+        params: Query parameters for the request
+        timeout: Request timeout in seconds (default: REQUEST_TIMEOUT)
+        revalidate: Whether to keep the response for conditional requests
+            (default: True); off for bulk pages that are rarely repeated
 
     Returns:
         Dictionary containing the API response
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails, including
+            OpenAlexError for non-JSON bodies and error documents
     """
-    base_url = "https://api.openalex.org/works"
+    store = get_revalidation_store()
+    key = (url, tuple(sorted(params.items())))
+    stored = store.get(key) if revalidate else None
 
-    params = {
-        "search": query,
-        "per-page": per_page,
-        "page": page,
-    }
+    get_rate_limiter().acquire()
+    response = get_session().get(
+        url, params=params, headers=stored[0] if stored else None, timeout=timeout
+    )
+    if response.status_code == 304 and stored is not None:
+        # Parse the raw body each time; callers may mutate the returned dict
+        return orjson.loads(stored[1])
 
-    headers = {
-        "User-Agent": "mailto:user@example.com"  # Polite pool access
-    }
+    response.raise_for_status()
+
+    # Rate-limit and gateway errors can arrive as 200 HTML pages; skip parsing them
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith("application/json"):
+        raise OpenAlexError(
+            f"Unexpected {content_type or 'untyped'} response from OpenAlex", response=response
+        )
+
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in OpenAlex response: {e}", response=response
+        ) from e
+
+    if isinstance(data, dict) and "error" in data:
+        raise OpenAlexError(
+            f"OpenAlex API error: {data.get('message') or data['error']}", response=response
+        )
+
+    # Only successful documents are kept for revalidation
+    conditional = {}
+    etag = response.headers.get("ETag")
+    if etag:
+        conditional["If-None-Match"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        conditional["If-Modified-Since"] = last_modified
+    if revalidate and conditional:
+        store.put(key, conditional, response.content)
+
+    return data
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_search_works(query: str, per_page: int, cursor: str) -> Dict[str, Any]:
+    """Fetch one page of works search results, memoized across reruns and users."""
+    params = {"search": query, "per-page": per_page, "cursor": cursor, "select": WORKS_SELECT}
+    # Users missing the cache for the same page at once share one request
+    return get_single_flight().run(("works", query, per_page, cursor), _fetch_json, WORKS_URL, params)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_search_authors(query: str, per_page: int) -> Dict[str, Any]:
+    """Fetch author search results, memoized across reruns and users."""
+    params = {"search": query, "per_page": per_page, "select": AUTHORS_SELECT}
+    return get_single_flight().run(("authors", query, per_page), _fetch_json, AUTHORS_URL, params)
+
+
+def search_openalex_works(query: str, per_page: int = 10, cursor: str = "*") -> Dict[str, Any]:
+    """
+    Search for works in OpenAlex API.
+
+    Uses cursor pagination, so fetching a page costs the same regardless of
+    how deep into the result set it is. The cursor for the following page is
+    returned in ``meta.next_cursor``.
+
+    Results are cached for an hour in a cache shared by all sessions, so
+    repeating a query does not hit the network again.
+
+    Args:
+        query: Search query string
+        per_page: Number of results per page (default: 10)
+        cursor: Pagination cursor, "*" for the first page (default: "*")
 
+    Returns:
+        Dictionary containing the API response
+    """
     try:
-        response = requests.get(base_url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return _cached_search_works(query, per_page, cursor)
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching data from OpenAlex API: {e}")
+        st.error(f"Error fetching data from OpenAlex API: {describe_error(e)}")
         return {}
 
 
+def prefetch_next_cursor_page(query: str, per_page: int, cursor: Optional[str]) -> None:
+    """
+    Start fetching the next page of works search results in the background.
+
+    The request runs on the shared thread pool and fills the search cache,
+    so moving to the next page is usually served without a network wait.
+
+    Args:
+        query: Search query string
+        per_page: Number of results per page
+        cursor: Cursor of the page to prefetch (nothing is done if empty)
+    """
+    if not cursor:
+        return
+
+    key = (query, per_page, cursor)
+    prefetched = st.session_state.get('works_prefetch')
+    if prefetched is None or prefetched[0] != key:
+        future = get_executor().submit(_cached_search_works, query, per_page, cursor)
+        st.session_state.works_prefetch = (key, future)
+
+
 def search_openalex_authors(query: str, per_page: int = 20) -> Optional[Dict]:
     """
     Search for authors in OpenAlex API.
 
+    Results are cached for an hour, so repeating a query does not hit the
+    network again.
+
     Args:
         query: Search query string
         per_page: Number of results per page (default: 20)
@@ -58,30 +506,28 @@ def search_openalex_authors(query: str, per_page: int = 20) -> Optional[Dict]:
     Returns:
         Dictionary containing the API response
     """
-    url = "https://api.openalex.org/authors"
-    params = {
-        "search": query,
-        "per_page": per_page,
-    }
-
-    headers = {
-        "User-Agent": "mailto:user@example.com"  # Polite pool access
-    }
-
     try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return _cached_search_authors(query, per_page)
     except requests.exceptions.RequestException as e:
-        st.error(f"Error searching authors: {e}")
+        st.error(f"Error searching authors: {describe_error(e)}")
         return None
 
 
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _cached_autocomplete_authors(query: str) -> List[Dict]:
+    """Fetch author autocomplete suggestions, memoized across reruns and users."""
+    # Short timeout and no retries so type-ahead fails fast during rate-limit windows
+    data = _fetch_json(AUTOCOMPLETE_AUTHORS_URL, {"q": query}, timeout=3)
+    return data.get('results', [])
+
+
 def autocomplete_authors(query: str) -> Optional[List[Dict]]:
     """
     Get autocomplete suggestions for author names using OpenAlex API.
 
-    This endpoint is optimized for fast type-ahead style search.
+    This endpoint is optimized for fast type-ahead style search. Suggestions
+    are cached for five minutes, keyed by the trimmed, lowercased query so
+    retyping the same prefix never repeats the request.
 
     Args:
         query: Partial author name to autocomplete
@@ -89,88 +535,103 @@ def autocomplete_authors(query: str) -> Optional[List[Dict]]:
     Returns:
         List of author suggestion dictionaries, or None if error occurs
     """
-    if not query or len(query) < 2:
+    query = (query or '').strip().lower()
+    if len(query) < 2:
         return []
 
-    url = "https://api.openalex.org/autocomplete/authors"
-    params = {"q": query}
-
-    headers = {
-        "User-Agent": "mailto:user@example.com"  # Polite pool access
-    }
-
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        return data.get('results', [])
+        return _cached_autocomplete_authors(query)
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching autocomplete suggestions: {e}")
+        st.error(f"Error fetching autocomplete suggestions: {describe_error(e)}")
         return []
 
 
-def fetch_author_works(author_id: str, per_page: int = 200) -> Optional[List[Dict]]:
+def normalize_author_id(author_id: str) -> str:
     """
-    Fetch all works for a specific author from OpenAlex API.
-
-    Supports pagination to retrieve all works beyond the 200-result limit.
+    Reduce an OpenAlex author ID to its short form.
 
     Args:
         author_id: OpenAlex author ID (e.g., 'A1234567890' or full URL)
-        per_page: Number of results per page (default: 200, max allowed)
 
     Returns:
-        List of work dictionaries, or None if error occurs
+        Short author ID such as 'A1234567890'
     """
-    # Extract the author ID from the full URL if needed
     if 'openalex.org' in author_id:
         author_id = author_id.split('/')[-1]
+    return author_id
 
-    url = "https://api.openalex.org/works"
-    params = {
-        "filter": f"author.id:{author_id}",
-        "per_page": per_page,
-        "sort": "publication_year:asc",
-    }
 
-    headers = {
-        "User-Agent": "mailto:user@example.com"
-    }
+def _iter_works(params: Dict[str, Any]) -> Iterator[Dict]:
+    """
+    Yield every work matching a filter by following OpenAlex cursors.
 
-    all_works = []
-    page = 1
+    Works are yielded page by page, so only one page is held at a time
+    unless the caller collects them.
 
-    try:
-        while True:
-            params["page"] = page
-            response = requests.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+    Args:
+        params: Query parameters (filter, per_page, select, ...) without a cursor
 
-            results = data.get('results', [])
-            if not results:
-                break
+    Yields:
+        Work dictionaries
 
-            all_works.extend(results)
+    Raises:
+        requests.exceptions.RequestException: If a request fails
+    """
+    params = dict(params)
 
-            # Check if we've got all results
-            meta = data.get('meta', {})
-            if len(all_works) >= meta.get('count', 0):
-                break
+    cursor = "*"
 
-            page += 1
+    # meta.count can drift while paging a live dataset, so stop only on an
+    # empty page or a missing next cursor
+    while cursor:
+        params["cursor"] = cursor
+        # Cursor pages of a walk are rarely requested again; don't store them
+        data = _fetch_json(WORKS_URL, params, revalidate=False)
 
-            # Safety limit to avoid infinite loops
-            if page > 50:
-                break
+        results = data.get('results', [])
+        if not results:
+            break
 
-        return all_works if all_works else []
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching author works: {e}")
-        return None
+        yield from results
 
+        cursor = data.get('meta', {}).get('next_cursor')
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _cached_author_works(author_id: str, per_page: int) -> List[Dict]:
+    """Fetch all works of an author, memoized across reruns and users."""
+    return list(_iter_works({
+        "filter": f"author.id:{author_id}",
+        "per_page": per_page,
+        "sort": "publication_year:asc",
+        "select": AUTHOR_WORKS_SELECT,
+    }))
 
-def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
+
+def start_works_for_authors(author_ids: List[str], per_page: int = 200) -> Dict[str, Future]:
+    """
+    Start fetching the works of several authors in the background.
+
+    Each author's works are walked with their own author.id filter on the
+    shared thread pool and cached per author, so overlapping author lists
+    reuse earlier walks. Filtering per author also avoids crediting works
+    from authorships, which OpenAlex truncates for large collaborations.
+
+    Args:
+        author_ids: OpenAlex author IDs (short form or full URL)
+        per_page: Number of results per page (default: 200, max allowed)
+
+    Returns:
+        Dictionary mapping short author IDs to futures resolving to their works
+    """
+    executor = get_executor()
+    return {
+        author_id: executor.submit(_cached_author_works, author_id, per_page)
+        for author_id in dict.fromkeys(normalize_author_id(author_id) for author_id in author_ids)
+    }
+
+
+def calculate_academic_age(author: Dict[str, Any], works: List[Dict]) -> Dict[str, Any]:
     """
     Calculate academic age and confidence score for an author.
 
@@ -179,6 +640,7 @@ def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
 
     Args:
         author: Author dictionary from OpenAlex API
+        works: List of the author's works from OpenAlex
 
     Returns:
         Dictionary containing:
@@ -191,12 +653,11 @@ def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
         - notes: Explanation of calculation
     """
     current_year = datetime.now().year
-    author_id = author.get('id', '')
 
-    # Fetch author's works
-    works = fetch_author_works(author_id)
+    # Count publications per year
+    year_counts = Counter(work.get('publication_year') for work in works)
 
-    if not works or len(works) == 0:
+    if not year_counts:
         return {
             'academic_age': None,
             'confidence_score': 0,
@@ -207,14 +668,15 @@ def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
             'notes': 'No publications found'
         }
 
-    # Extract publication years
-    pub_years = []
-    for work in works:
-        year = work.get('publication_year')
-        if year and year > 1900 and year <= current_year:  # Sanity check
-            pub_years.append(year)
+    total_works = sum(year_counts.values())
+
+    # Keep valid publication years only
+    year_counts = {
+        year: count for year, count in year_counts.items()
+        if year and year > 1900 and year <= current_year  # Sanity check
+    }
 
-    if not pub_years:
+    if not year_counts:
         return {
             'academic_age': None,
             'confidence_score': 0,
@@ -225,31 +687,32 @@ def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
             'notes': 'No valid publication years found'
         }
 
-    pub_years.sort()
-    earliest_year = pub_years[0]
+    earliest_year = min(year_counts)
 
-    # Count publications per year
-    year_counts = defaultdict(int)
-    for year in pub_years:
-        year_counts[year] += 1
+    # Lay the counts out as a dense array starting at the earliest year,
+    # padded with two empty years so every start year has a full 3-year window
+    dense_counts = np.zeros(current_year - earliest_year + 3, dtype=np.int64)
+    n_years = len(year_counts)
+    dense_counts[np.fromiter(year_counts.keys(), dtype=np.int64, count=n_years) - earliest_year] = \
+        np.fromiter(year_counts.values(), dtype=np.int64, count=n_years)
 
     # Find first year of sustained activity (at least 2 pubs within any 3-year window)
-    sustained_start_year = None
-    for year in range(earliest_year, current_year + 1):
-        pubs_in_window = sum(year_counts.get(y, 0) for y in range(year, year + 3))
-        if pubs_in_window >= 2:
-            sustained_start_year = year
-            break
+    # using a prefix sum: window[i] = pubs in [earliest_year + i, earliest_year + i + 2]
+    cumulative = np.concatenate(([0], np.cumsum(dense_counts)))
+    window_pubs = cumulative[3:] - cumulative[:-3]
+    first_window = int(np.argmax(window_pubs >= 2))
 
     # If no sustained activity found, use earliest year
-    if sustained_start_year is None:
+    if window_pubs[first_window] >= 2:
+        sustained_start_year = earliest_year + first_window
+    else:
         sustained_start_year = earliest_year
 
     # Calculate academic age
     academic_age = current_year - sustained_start_year
 
     # Count excluded publications (before sustained activity)
-    excluded_pubs = sum(1 for y in pub_years if y < sustained_start_year)
+    excluded_pubs = sum(count for year, count in year_counts.items() if year < sustained_start_year)
 
     # Calculate confidence score components
     confidence_components = []
@@ -272,7 +735,8 @@ def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
 
     # 2. Publication volume consistency (30% weight)
     # More publications in early sustained period = higher confidence
-    early_period_pubs = sum(1 for y in pub_years if sustained_start_year <= y < sustained_start_year + 5)
+    early_period_pubs = sum(count for year, count in year_counts.items()
+                            if sustained_start_year <= year < sustained_start_year + 5)
     if early_period_pubs >= 10:
         volume_score = 1.0
     elif early_period_pubs >= 5:
@@ -286,8 +750,8 @@ def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
 
     # 3. Topic consistency (30% weight)
     # Compare early papers' topics with overall author profile
-    author_concepts = author.get('x_concepts', [])
-    if author_concepts and len(works) >= 5:
+    author_concepts = author.get('x_concepts') or []
+    if author_concepts and total_works >= 5:
         # Get top author concepts
         top_author_concepts = set(c.get('display_name', '').lower()
                                   for c in author_concepts[:10] if c.get('display_name'))
@@ -298,13 +762,12 @@ def calculate_academic_age(author: Dict[str, Any]) -> Dict[str, Any]:
                       sustained_start_year <= w.get('publication_year') < sustained_start_year + 5]
 
         if early_works:
-            early_concepts = set()
-            for work in early_works[:10]:  # Sample first 10 early works
-                work_concepts = work.get('concepts', [])
-                for concept in work_concepts[:5]:  # Top 5 concepts per work
-                    concept_name = concept.get('display_name', '').lower()
-                    if concept_name:
-                        early_concepts.add(concept_name)
+            # Top 5 concepts from each of the first 10 early works
+            early_concepts = {
+                (concept.get('display_name') or '').lower()
+                for work in early_works[:10]
+                for concept in (work.get('concepts') or [])[:5]
+            } - {''}
 
             # Calculate overlap
             if early_concepts and top_author_concepts:
@@ -372,29 +835,35 @@ def calculate_author_metrics(works: Optional[List[Dict]], h_index: int, works_co
             'h_index_efficiency': 0
         }
 
+    n_works = len(works)
+
     # Extract citation counts
-    citation_counts = [work.get('cited_by_count', 0) for work in works]
-    citation_counts_sorted = sorted(citation_counts, reverse=True)
+    citation_counts = np.fromiter(
+        (work.get('cited_by_count') or 0 for work in works), dtype=np.int64, count=n_works
+    )
 
     # 1. Median citations per work
-    median_citations = statistics.median(citation_counts) if citation_counts else 0
+    median_citations = float(np.median(citation_counts))
 
     # 2. Mean citations per work
-    mean_citations = statistics.mean(citation_counts) if citation_counts else 0
+    mean_citations = float(citation_counts.mean())
 
-    # 3. Top 10% citation concentration
-    total_citations = sum(citation_counts)
+    # 3. Top 10% citation concentration (partial selection, no full sort needed)
+    total_citations = int(citation_counts.sum())
     if total_citations > 0:
-        top_10_percent_count = max(1, len(works) // 10)
-        top_10_percent_citations = sum(citation_counts_sorted[:top_10_percent_count])
+        top_10_percent_count = max(1, n_works // 10)
+        top_citations = np.partition(citation_counts, -top_10_percent_count)[-top_10_percent_count:]
+        top_10_percent_citations = int(top_citations.sum())
         top_10_concentration = (top_10_percent_citations / total_citations) * 100
     else:
         top_10_concentration = 0
 
     # 4. Recent activity rate (last 5 years)
     current_year = datetime.now().year
-    recent_works = [w for w in works if w.get('publication_year', 0) >= current_year - 5]
-    recent_activity_rate = (len(recent_works) / len(works)) * 100 if works else 0
+    pub_years = np.fromiter(
+        (work.get('publication_year') or 0 for work in works), dtype=np.int64, count=n_works
+    )
+    recent_activity_rate = (np.count_nonzero(pub_years >= current_year - 5) / n_works) * 100
 
     # 5. h-index efficiency
     h_index_efficiency = (h_index / works_count) if works_count > 0 else 0
@@ -408,69 +877,216 @@ def calculate_author_metrics(works: Optional[List[Dict]], h_index: int, works_co
     }
 
 
-def display_work(work: Dict[str, Any]) -> None:
+class WorkRow(NamedTuple):
+    """Fields of an OpenAlex work used for display."""
+    title: str
+    authorships: List[Dict[str, Any]]
+    publication_year: Optional[int]
+    venue: Optional[str]
+    cited_by_count: int
+    doi: Optional[str]
+    id: Optional[str]
+
+
+_WORK_GETTER = operator.itemgetter(
+    "title", "authorships", "publication_year", "cited_by_count", "doi", "id"
+)
+_VENUE_PATH = ("primary_location", "source", "display_name")
+
+
+def _safe_path(data: Any, path: Tuple[str, ...]) -> Any:
+    """Follow a sequence of keys through nested dicts, returning None at the first gap."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def get_work_fields(work: Dict[str, Any]) -> WorkRow:
     """
-    Display a single work in the Streamlit UI.
+    Extract the displayed fields of a work in one pass.
 
     Args:
         work: Dictionary containing work data from OpenAlex API
+
+    Returns:
+        WorkRow with defaults filled in for missing values
+    """
+    try:
+        title, authorships, pub_year, cited_by_count, doi, openalex_id = _WORK_GETTER(work)
+    except KeyError:
+        # Records lacking a selected field fall back to per-key lookups
+        title, authorships, pub_year, cited_by_count, doi, openalex_id = (
+            work.get(key) for key in ("title", "authorships", "publication_year",
+                                      "cited_by_count", "doi", "id")
+        )
+
+    return WorkRow(
+        title=title or "No title available",
+        authorships=authorships or [],
+        publication_year=pub_year,
+        venue=_safe_path(work, _VENUE_PATH),
+        cited_by_count=cited_by_count or 0,
+        doi=doi,
+        id=openalex_id,
+    )
+
+
+def format_author_names(authorships: List[Dict[str, Any]]) -> str:
+    """
+    Format the author list of a work as a comma-separated string.
+
+    Args:
+        authorships: List of authorship dictionaries from a work
+
+    Returns:
+        Names of the first 5 authors, followed by "et al." if there are more
     """
-    # Title
-    title = work.get("title", "No title available")
-    st.markdown(f"### {title}")
+    # Limit to first 5 authors; a list comprehension joins faster than a generator
+    names = [
+        (authorship.get("author") or {}).get("display_name", "Unknown")
+        for authorship in authorships[:5]
+    ]
+
+    if len(authorships) > 5:
+        names.append("et al.")
 
-    # Authors
-    authorships = work.get("authorships", [])
-    if authorships:
-        authors = []
-        for authorship in authorships[:5]:  # Limit to first 5 authors
-            author = authorship.get("author", {})
-            author_name = author.get("display_name", "Unknown")
-            authors.append(author_name)
+    return ", ".join(names)
 
-        if len(authorships) > 5:
-            authors.append("et al.")
 
-        st.write(f"**Authors:** {', '.join(authors)}")
+def works_to_df(works: List[Dict[str, Any]], start: int = 1) -> pd.DataFrame:
+    """
+    Convert a list of works into a DataFrame for tabular display.
 
-    # Publication year
-    pub_year = work.get("publication_year")
-    if pub_year:
-        st.write(f"**Year:** {pub_year}")
+    Args:
+        works: List of work dictionaries from OpenAlex API
+        start: Result number of the first work, used as the index (default: 1)
 
-    # Publication venue
-    primary_location = work.get("primary_location", {})
-    source = primary_location.get("source", {})
-    source_name = source.get("display_name")
-    if source_name:
-        st.write(f"**Published in:** {source_name}")
+    Returns:
+        DataFrame with one row per work
+    """
+    rows = [
+        {
+            "title": row.title,
+            "authors": format_author_names(row.authorships),
+            "year": row.publication_year,
+            "venue": row.venue,
+            "citations": row.cited_by_count,
+            "doi": row.doi,
+            "id": row.id,
+        }
+        for row in map(get_work_fields, works)
+    ]
+    return pd.DataFrame(rows, index=pd.RangeIndex(start, start + len(rows)))
 
-    # Citation count
-    cited_by_count = work.get("cited_by_count", 0)
-    st.write(f"**Citations:** {cited_by_count}")
 
+def display_works_table(works: List[Dict[str, Any]], start: int = 1) -> None:
+    """
+    Display works as a single table in the Streamlit UI.
+
+    Rendering one dataframe element is much cheaper than emitting a group of
+    markdown elements per result.
+
+    Args:
+        works: List of work dictionaries from OpenAlex API
+        start: Result number of the first work (default: 1)
+    """
+    st.dataframe(
+        works_to_df(works, start),
+        column_config={
+            "title": st.column_config.TextColumn("Title", width="large"),
+            "authors": st.column_config.TextColumn("Authors"),
+            "year": st.column_config.NumberColumn("Year", format="%d"),
+            "venue": st.column_config.TextColumn("Published in"),
+            "citations": st.column_config.NumberColumn("Citations"),
+            "doi": st.column_config.LinkColumn("DOI"),
+            "id": st.column_config.LinkColumn("OpenAlex"),
+        },
+        use_container_width=True,
+    )
+
+
+# Markdown layout of format_work; optional fields carry their own trailing
+# blank line so that an empty value leaves no gap
+_WORK_MD_TEMPLATE = (
+    "### {title}\n\n"
+    "{authors}"
+    "{year}"
+    "{venue}"
+    "**Citations:** {cited_by_count}\n\n"
+    "{links}"
+    "---"
+)
+
+
+def _format_work_markdown(title: str, authors: str, pub_year: Optional[int],
+                          source_name: Optional[str], cited_by_count: int,
+                          doi: Optional[str], openalex_id: Optional[str]) -> str:
+    """Fill the work template from already extracted, hashable fields."""
     # DOI and OpenAlex ID links
-    col1, col2 = st.columns(2)
+    links = " | ".join(
+        link for link in (
+            f"[DOI Link]({doi})" if doi else "",
+            f"[OpenAlex]({openalex_id})" if openalex_id else "",
+        ) if link
+    )
 
-    with col1:
-        doi = work.get("doi")
-        if doi:
-            st.markdown(f"[DOI Link]({doi})")
+    # Optional lines are passed as empty strings so they drop out of the template
+    return _WORK_MD_TEMPLATE.format_map({
+        "title": title,
+        "authors": f"**Authors:** {authors}\n\n" if authors else "",
+        "year": f"**Year:** {pub_year}\n\n" if pub_year else "",
+        "venue": f"**Published in:** {source_name}\n\n" if source_name else "",
+        "cited_by_count": cited_by_count,
+        "links": f"{links}\n\n" if links else "",
+    })
 
-    with col2:
-        openalex_id = work.get("id")
-        if openalex_id:
-            st.markdown(f"[OpenAlex]({openalex_id})")
 
-    st.divider()
+@st.cache_resource
+def get_work_markdown_formatter() -> Callable[..., str]:
+    """
+    Get the memoized work formatter shared across reruns and users.
+
+    A module-level lru_cache would be rebuilt on every rerun, since Streamlit
+    re-executes the script; holding it as a resource keeps it alive.
+
+    Returns:
+        _format_work_markdown wrapped in an LRU cache of 4096 entries
+    """
+    return functools.lru_cache(maxsize=4096)(_format_work_markdown)
 
 
-def display_authors(authors_data: Dict) -> None:
+def format_work(work: Dict[str, Any]) -> str:
+    """
+    Format a single work as a Markdown block.
+
+    Works seen before (for example across overlapping searches) are served
+    from an in-process LRU cache keyed on the displayed field values.
+
+    Args:
+        work: Dictionary containing work data from OpenAlex API
+
+    Returns:
+        Markdown with the title, authors, year, venue, citations and links,
+        ending with a horizontal rule
+    """
+    title, authorships, pub_year, source_name, cited_by_count, doi, openalex_id = get_work_fields(work)
+
+    return get_work_markdown_formatter()(
+        title, format_author_names(authorships), pub_year, source_name,
+        cited_by_count, doi, openalex_id,
+    )
+
+
+def display_authors(authors_data: Dict, works_futures: Optional[Dict[str, Future]] = None) -> None:
     """
     Display authors search results.
 
     Args:
         authors_data: Dictionary containing author search results
+        works_futures: Optional futures from start_works_for_authors for the
+            authors on this page; started here if not given
     """
     if not authors_data or 'results' not in authors_data:
         st.warning("No results found.")
@@ -479,6 +1095,17 @@ def display_authors(authors_data: Dict) -> None:
     results = authors_data['results']
     st.success(f"Found {authors_data.get('meta', {}).get('count', 0)} total results")
 
+    # Works for every author on the page arrive in the background while the
+    # author cards render; each card only waits for its own author
+    if works_futures is None:
+        works_futures = start_works_for_authors(
+            [author['id'] for author in results if author.get('id')]
+        )
+
+    # Per-session memo of the analyses, so reruns skip recomputing them
+    age_cache = st.session_state.setdefault('age_cache', {})
+    metrics_cache = st.session_state.setdefault('metrics_cache', {})
+
     for author in results:
         with st.expander(f"👤 {author.get('display_name', 'Unknown Author')}"):
             col1, col2, col3 = st.columns([2, 1, 1])
@@ -504,7 +1131,7 @@ def display_authors(authors_data: Dict) -> None:
 
             with col2:
                 # Works count
-                works_count = author.get('works_count', 0)
+                works_count = author.get('works_count') or 0
                 st.metric("Works", works_count)
 
                 # Cited by count
@@ -512,20 +1139,43 @@ def display_authors(authors_data: Dict) -> None:
                 st.metric("Citations", cited_by)
 
             with col3:
+                # OpenAlex sends null rather than omitting missing objects
+                summary_stats = author.get('summary_stats') or {}
+
                 # H-index
-                h_index = author.get('summary_stats', {}).get('h_index', 0)
+                h_index = summary_stats.get('h_index') or 0
                 st.metric("h-index", h_index)
 
                 # i10-index
-                i10_index = author.get('summary_stats', {}).get('i10_index', 0)
+                i10_index = summary_stats.get('i10_index') or 0
                 st.metric("i10-index", i10_index)
 
+            # Reuse analyses already computed for this author in this session
+            author_id = author.get('id', '')
+            age_data = age_cache.get(author_id)
+            metrics = metrics_cache.get((author_id, h_index))
+            needs_works = age_data is None or (metrics is None and author_id and works_count > 0)
+
+            # Share the author's works between both analyses; None means the
+            # fetch failed, and such results are not memoized
+            works = None
+            works_future = works_futures.get(normalize_author_id(author_id)) if author_id else None
+            if needs_works and works_future is not None:
+                with st.spinner("Fetching publications..."):
+                    try:
+                        works = works_future.result()
+                    except requests.exceptions.RequestException as e:
+                        st.error(f"Error fetching author works: {describe_error(e)}")
+
             # Academic Age Section
             st.markdown("---")
             st.markdown("**📅 Academic Age Analysis**")
 
-            with st.spinner("Calculating academic age..."):
-                age_data = calculate_academic_age(author)
+            if age_data is None:
+                with st.spinner("Calculating academic age..."):
+                    age_data = calculate_academic_age(author, works=works or [])
+                if author_id and works is not None:
+                    age_cache[author_id] = age_data
 
             if age_data['academic_age'] is not None:
                 col_age1, col_age2, col_age3 = st.columns(3)
@@ -572,10 +1222,11 @@ def display_authors(authors_data: Dict) -> None:
             st.markdown("**📊 Advanced Publication Metrics**")
 
             with st.spinner("Calculating advanced metrics..."):
-                author_id = author.get('id', '')
                 if author_id and works_count > 0:
-                    works = fetch_author_works(author_id)
-                    metrics = calculate_author_metrics(works, h_index, works_count)
+                    if metrics is None:
+                        metrics = calculate_author_metrics(works, h_index, works_count)
+                        if works is not None:
+                            metrics_cache[(author_id, h_index)] = metrics
 
                     # Display advanced metrics in two rows
                     col1, col2, col3 = st.columns(3)
@@ -619,34 +1270,102 @@ def display_authors(authors_data: Dict) -> None:
 
             # Concepts
             st.markdown("---")
-            concepts = author.get('x_concepts', [])
+            concepts = author.get('x_concepts') or []
             if concepts:
                 st.markdown("**Research Areas:**")
                 concept_names = [c.get('display_name', '') for c in concepts[:5]]
                 st.markdown(", ".join(concept_names))
 
 
-def main():
-    """Main function to run the Streamlit app."""
-    st.set_page_config(
-        page_title="OpenAlex Search",
-        page_icon="🔍",
-        layout="wide"
-    )
+def start_works_search(query: str, per_page: int, cursor: str = "*") -> None:
+    """
+    Begin a new works search, discarding any previously loaded results.
 
-    st.title("🔍 OpenAlex Search")
-    st.markdown("""
-    Search for academic works and authors using the [OpenAlex API](https://docs.openalex.org/).
-    OpenAlex is a free and open catalog of scholarly papers, authors, institutions, and more.
-    """)
+    Args:
+        query: Search query string
+        per_page: Number of results per page
+        cursor: Cursor of the first page to load (default: "*")
+    """
+    # Surrounding whitespace would only split the search cache
+    st.session_state.works_search = (query.strip(), per_page)
+    st.session_state.works_results = []
+    st.session_state.works_total = 0
+    st.session_state.works_cursor = cursor
+    st.session_state.works_load_more = True
 
-    # Create tabs
-    tab1, tab2 = st.tabs(["📚 Search Works", "👤 Search Authors"])
 
-    # Works Search Tab
-    with tab1:
-        st.header("Search for Academic Works")
+def clear_works_search() -> None:
+    """Forget the active works search, its loaded results and its URL state."""
+    st.session_state.works_search = None
+    st.session_state.works_results = []
+    st.session_state.works_total = 0
+    st.session_state.works_cursor = None
+    st.session_state.works_load_more = False
+    for key in ("q", "per_page", "cursor"):
+        st.query_params.pop(key, None)
+
+
+def request_more_works() -> None:
+    """Load the next page of works on the upcoming rerun."""
+    st.session_state.works_load_more = True
+
+
+def load_next_works_page() -> None:
+    """
+    Fetch the next page of the active works search and append it to the results.
+
+    The cursor of the loaded page is written to the URL so that reloading the
+    app resumes the search from there.
+    """
+    query, per_page = st.session_state.works_search
+    cursor = st.session_state.works_cursor
+
+    # A prefetch still in flight for this page is joined rather than repeated
+    results = search_openalex_works(query=query, per_page=per_page, cursor=cursor)
+
+    if not results or "results" not in results:
+        st.warning("No results returned. Please try a different query.")
+        return
 
+    meta = results.get("meta", {})
+    st.session_state.works_results.extend(results["results"])
+    st.session_state.works_total = meta.get("count", 0)
+    st.session_state.works_cursor = meta.get("next_cursor")
+    st.query_params.update({"q": query, "per_page": str(per_page), "cursor": cursor})
+
+    # Fetch the next page while the user reads this one
+    prefetch_next_cursor_page(query, per_page, st.session_state.works_cursor)
+
+
+@st.fragment
+def works_tab() -> None:
+    """
+    Render the works search tab.
+
+    Runs as a fragment, so interacting with its widgets reruns only this tab.
+    """
+    st.header("Search for Academic Works")
+
+    # Initialize session state, resuming a search recorded in the URL
+    if 'works_search' not in st.session_state:
+        url_query = st.query_params.get("q")
+        if url_query:
+            try:
+                # Clamp and snap to the slider's range and step
+                per_page = min(max(round(int(st.query_params.get("per_page", 10)) / 5) * 5, 5), 50)
+            except ValueError:
+                per_page = 10
+            st.session_state.works_query = url_query
+            st.session_state.works_per_page = per_page
+            start_works_search(
+                url_query, per_page, cursor=st.query_params.get("cursor", "*")
+            )
+        else:
+            clear_works_search()
+
+    # Search widgets are batched in a form so editing them does not rerun
+    # the tab until the search is submitted
+    with st.form("works_search_form"):
         # Search input
         search_query = st.text_input(
             "Enter your search query:",
@@ -655,191 +1374,221 @@ def main():
             key="works_query"
         )
 
-        # Search options
-        col1, col2 = st.columns([3, 1])
-
-        with col1:
-            results_per_page = st.slider(
-                "Results per page:",
-                min_value=5,
-                max_value=50,
-                value=10,
-                step=5,
-                key="works_per_page"
-            )
-
-        with col2:
-            page_number = st.number_input(
-                "Page:",
-                min_value=1,
-                max_value=100,
-                value=1,
-                step=1,
-                key="works_page"
-            )
+        # Search options; the default lives in session state, where a
+        # search resumed from the URL seeds its own value
+        st.session_state.setdefault("works_per_page", 10)
+        results_per_page = st.slider(
+            "Results per page:",
+            min_value=5,
+            max_value=50,
+            step=5,
+            key="works_per_page"
+        )
 
         # Search button
-        if st.button("🔍 Search Works", type="primary", key="search_works"):
-            if search_query:
-                with st.spinner("Searching OpenAlex..."):
-                    results = search_openalex_works(
-                        query=search_query,
-                        per_page=results_per_page,
-                        page=page_number
-                    )
+        submitted = st.form_submit_button("🔍 Search Works", type="primary")
 
-                if results and "results" in results:
-                    works = results["results"]
-                    meta = results.get("meta", {})
-                    total_count = meta.get("count", 0)
-
-                    # Display results summary
-                    st.success(f"Found {total_count:,} works")
-
-                    # Display each work
-                    if works:
-                        st.markdown("---")
-                        for idx, work in enumerate(works, start=1):
-                            st.markdown(f"#### Result {idx}")
-                            display_work(work)
-                    else:
-                        st.info("No results found for your query.")
-                else:
-                    st.warning("No results returned. Please try a different query.")
-            else:
-                st.warning("Please enter a search query.")
+    if submitted:
+        if search_query:
+            start_works_search(search_query, results_per_page)
+        else:
+            st.warning("Please enter a search query.")
+
+    if st.session_state.works_load_more:
+        st.session_state.works_load_more = False
+        with st.spinner("Searching OpenAlex..."):
+            load_next_works_page()
+
+    if st.session_state.works_search:
+        works = st.session_state.works_results
+
+        if works:
+            # Display results summary
+            st.success(f"Showing {len(works):,} of {st.session_state.works_total:,} works")
+
+            display_works_table(works)
+
+            # Per-work view is opt-in; all results go out as one markdown element
+            if st.toggle("Show detailed view", key="works_detailed"):
+                st.markdown("---")
+                st.markdown("\n\n".join(
+                    f"#### Result {idx}\n\n{format_work(work)}"
+                    for idx, work in enumerate(works, start=1)
+                ))
+
+            col_more, col_new = st.columns(2)
+            with col_more:
+                st.button(
+                    "⬇ Load more results",
+                    key="works_more",
+                    on_click=request_more_works,
+                    disabled=not st.session_state.works_cursor
+                )
+            with col_new:
+                st.button(
+                    "🗑 New search",
+                    key="works_new_search",
+                    on_click=clear_works_search
+                )
+        elif st.session_state.works_cursor is None:
+            st.info("No results found for your query.")
+
+
+@st.fragment
+def authors_tab() -> None:
+    """
+    Render the authors search tab.
 
-    # Authors Search Tab
-    with tab2:
-        st.header("Search for Authors")
+    Runs as a fragment, so interacting with its widgets reruns only this tab.
+    """
+    st.header("Search for Authors")
+
+    # Initialize session state for autocomplete
+    if 'author_suggestions' not in st.session_state:
+        st.session_state.author_suggestions = []
+    if 'selected_author' not in st.session_state:
+        st.session_state.selected_author = None
+
+    st.info("💡 **Tip:** Type an author name and press Enter to see autocomplete suggestions, or enter a full name to search directly.")
+
+    # Create columns for input and autocomplete button
+    col_input, col_autocomplete = st.columns([3, 1])
+
+    with col_input:
+        # Text input for author name with autocomplete
+        author_input = st.text_input(
+            "Enter author name:",
+            placeholder="e.g., John Smith",
+            key="author_name_input",
+            help="Type at least 2 characters and press Enter, or click 'Get Suggestions'"
+        )
+
+    with col_autocomplete:
+        # Button to trigger autocomplete explicitly
+        st.markdown("<br>", unsafe_allow_html=True)  # Align button with input
+        autocomplete_btn = st.button(
+            "🔍 Get Suggestions",
+            key="autocomplete_button",
+            help="Click to fetch author suggestions"
+        )
+
+    # Fetch autocomplete suggestions when button is clicked or when Enter is pressed
+    should_fetch_suggestions = False
 
-        # Initialize session state for autocomplete
-        if 'author_suggestions' not in st.session_state:
-            st.session_state.author_suggestions = []
-        if 'selected_author' not in st.session_state:
+    # Check if button was clicked
+    if autocomplete_btn and author_input and len(author_input) >= 2:
+        should_fetch_suggestions = True
+    # Check if text input changed (user pressed Enter)
+    elif author_input and len(author_input) >= 2:
+        if 'last_author_input' not in st.session_state or st.session_state.last_author_input != author_input:
+            st.session_state.last_author_input = author_input
+            should_fetch_suggestions = True
+
+    # Fetch suggestions if needed
+    if should_fetch_suggestions:
+        with st.spinner("Fetching suggestions..."):
+            st.session_state.author_suggestions = autocomplete_authors(author_input)
             st.session_state.selected_author = None
 
-        st.info("💡 **Tip:** Type an author name and press Enter to see autocomplete suggestions, or enter a full name to search directly.")
+    # Display autocomplete suggestions if available
+    if st.session_state.author_suggestions and len(st.session_state.author_suggestions) > 0:
+        st.success(f"Found {len(st.session_state.author_suggestions)} suggestions")
 
-        # Create columns for input and autocomplete button
-        col_input, col_autocomplete = st.columns([3, 1])
+        # Create a dictionary mapping display text to author data
+        suggestions_dict = {}
+        for author in st.session_state.author_suggestions:
+            display_name = author.get('display_name', 'Unknown')
+            hint = author.get('hint', '')
+            works_count = author.get('works_count', 0)
 
-        with col_input:
-            # Text input for author name with autocomplete
-            author_input = st.text_input(
-                "Enter author name:",
-                placeholder="e.g., John Smith",
-                key="author_name_input",
-                help="Type at least 2 characters and press Enter, or click 'Get Suggestions'"
-            )
+            # Format the display text
+            if hint:
+                display_text = f"{display_name} ({hint}) - {works_count} works"
+            else:
+                display_text = f"{display_name} - {works_count} works"
 
-        with col_autocomplete:
-            # Button to trigger autocomplete explicitly
-            st.markdown("<br>", unsafe_allow_html=True)  # Align button with input
-            autocomplete_btn = st.button(
-                "🔍 Get Suggestions",
-                key="autocomplete_button",
-                help="Click to fetch author suggestions"
-            )
+            suggestions_dict[display_text] = author
 
-        # Fetch autocomplete suggestions when button is clicked or when Enter is pressed
-        should_fetch_suggestions = False
+        # Selectbox for choosing from suggestions
+        selected_display = st.selectbox(
+            "Select an author from suggestions:",
+            options=[""] + list(suggestions_dict.keys()),
+            format_func=lambda x: "-- Choose an author --" if x == "" else x,
+            key="author_selectbox"
+        )
 
-        # Check if button was clicked
-        if autocomplete_btn and author_input and len(author_input) >= 2:
-            should_fetch_suggestions = True
-        # Check if text input changed (user pressed Enter)
-        elif author_input and len(author_input) >= 2:
-            if 'last_author_input' not in st.session_state or st.session_state.last_author_input != author_input:
-                st.session_state.last_author_input = author_input
-                should_fetch_suggestions = True
-
-        # Fetch suggestions if needed
-        if should_fetch_suggestions:
-            with st.spinner("Fetching suggestions..."):
-                st.session_state.author_suggestions = autocomplete_authors(author_input)
-                st.session_state.selected_author = None
-
-        # Display autocomplete suggestions if available
-        if st.session_state.author_suggestions and len(st.session_state.author_suggestions) > 0:
-            st.success(f"Found {len(st.session_state.author_suggestions)} suggestions")
-
-            # Create a dictionary mapping display text to author data
-            suggestions_dict = {}
-            for author in st.session_state.author_suggestions:
-                display_name = author.get('display_name', 'Unknown')
-                hint = author.get('hint', '')
-                works_count = author.get('works_count', 0)
-
-                # Format the display text
-                if hint:
-                    display_text = f"{display_name} ({hint}) - {works_count} works"
-                else:
-                    display_text = f"{display_name} - {works_count} works"
+        # Update selected author when user picks from selectbox
+        if selected_display and selected_display != "":
+            st.session_state.selected_author = suggestions_dict[selected_display]
+            # Show selected author info
+            selected = st.session_state.selected_author
+            st.info(f"✓ Selected: **{selected.get('display_name')}** - Click 'Search Authors' below to view details")
+    elif author_input and len(author_input) >= 2 and should_fetch_suggestions:
+        st.warning("No suggestions found. Try a different name or search directly.")
 
-                suggestions_dict[display_text] = author
+    st.markdown("---")
 
-            # Selectbox for choosing from suggestions
-            selected_display = st.selectbox(
-                "Select an author from suggestions:",
-                options=[""] + list(suggestions_dict.keys()),
-                format_func=lambda x: "-- Choose an author --" if x == "" else x,
-                key="author_selectbox"
-            )
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        authors_per_page = st.slider(
+            "Results per page:",
+            5, 50, 20,
+            key="authors_per_page"
+        )
+    with col2:
+        authors_search_btn = st.button(
+            "🔍 Search Authors",
+            type="primary",
+            key="search_authors"
+        )
 
-            # Update selected author when user picks from selectbox
-            if selected_display and selected_display != "":
-                st.session_state.selected_author = suggestions_dict[selected_display]
-                # Show selected author info
-                selected = st.session_state.selected_author
-                st.info(f"✓ Selected: **{selected.get('display_name')}** - Click 'Search Authors' below to view details")
-        elif author_input and len(author_input) >= 2 and should_fetch_suggestions:
-            st.warning("No suggestions found. Try a different name or search directly.")
-
-        st.markdown("---")
-
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            authors_per_page = st.slider(
-                "Results per page:",
-                5, 50, 20,
-                key="authors_per_page"
-            )
-        with col2:
-            authors_search_btn = st.button(
-                "🔍 Search Authors",
-                type="primary",
-                key="search_authors"
-            )
+    # Perform search when button is clicked
+    if authors_search_btn:
+        search_query = None
+
+        # Use selected author's name if available, otherwise use text input
+        if st.session_state.selected_author:
+            search_query = st.session_state.selected_author.get('display_name')
+        elif author_input:
+            search_query = author_input
+
+        if search_query:
+            with st.spinner("Searching..."):
+                authors_data = search_openalex_authors(search_query, authors_per_page)
+                if authors_data:
+                    # Kick off the works fetch before any card is rendered
+                    works_futures = start_works_for_authors([
+                        author['id'] for author in authors_data.get('results', [])
+                        if author.get('id')
+                    ])
+                    display_authors(authors_data, works_futures)
+        else:
+            st.warning("Please enter an author name or select from suggestions.")
 
-        # Perform search when button is clicked
-        if authors_search_btn:
-            search_query = None
-
-            # Use selected author's name if available, otherwise use text input
-            if st.session_state.selected_author:
-                search_query = st.session_state.selected_author.get('display_name')
-            elif author_input:
-                search_query = author_input
-
-            if search_query:
-                with st.spinner("Searching..."):
-                    authors_data = search_openalex_authors(search_query, authors_per_page)
-                    if authors_data:
-                        display_authors(authors_data)
-            else:
-                st.warning("Please enter an author name or select from suggestions.")
+
+def main():
+    """Main function to run the Streamlit app."""
+    st.set_page_config(
+        page_title="OpenAlex Search",
+        page_icon="🔍",
+        layout="wide"
+    )
+
+    st.title(TITLE_MD)
+    st.markdown(INTRO_MD)
+
+    # Create tabs
+    tab1, tab2 = st.tabs(["📚 Search Works", "👤 Search Authors"])
+
+    with tab1:
+        works_tab()
+
+    with tab2:
+        authors_tab()
 
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style='text-align: center'>
-        <small>
-        Data from <a href="https://openalex.org" target="_blank">OpenAlex</a> |
-        <a href="https://docs.openalex.org/" target="_blank">API Documentation</a>
-        </small>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":